@@ -1,29 +1,28 @@
 """The Rently integration."""
 from __future__ import annotations
 
-import asyncio
-
 from openly.cloud import RentlyCloud
 from openly.devices import Lock
-from openly.exceptions import InvalidResponseError, RentlyAuthError
+from openly.devices.base_device import BaseDevice
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .config_flow import API_URL, LOGIN_URL
 from .const import DOMAIN
 from .coordinator import CloudCoordinator
-from .hub import HubEntity
 from .lock import LockEntity
 
 CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
 
-PLATFORMS: list[Platform] = [Platform.LOCK]
+# Entity class for each supported device type
+DEVICE_ENTITIES: dict[type[BaseDevice], type[CoordinatorEntity]] = {
+    Lock: LockEntity,
+}
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -47,41 +46,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # If you do not want to retry setup on failure, use
     # coordinator.async_refresh() instead
     #
-    coordinator = CloudCoordinator(hass, cloud)
+    coordinator = CloudCoordinator(hass, entry, cloud)
     # Initialize coordinator and login
     await coordinator.async_config_entry_first_refresh()
 
-    try:
-        async with asyncio.timeout(10):
-            # Use lists as transactions
-            locks = []
-            hubs = []
-            # Retrieve list of hubs from coordinator data
-            for hub in coordinator.data:
-                hubs.append(HubEntity(coordinator, hub.id))
-
-                # Get list of devices
-                devices_data = await hass.async_add_executor_job(
-                    cloud.get_devices, hub.id
-                )
-                for device in devices_data:
-                    if isinstance(device, Lock):
-                        locks.append(LockEntity(coordinator, device.id))
-
-            # Save data
-            coordinator.hubs = hubs
-            coordinator.locks = locks
-    except RentlyAuthError as err:
-        # Raising ConfigEntryAuthFailed will cancel future updates
-        # and start a config flow with SOURCE_REAUTH (async_step_reauth)
-        raise ConfigEntryAuthFailed from err
-    except InvalidResponseError as err:
-        raise UpdateFailed("Error communicating with API") from err
+    # Build entities from coordinator data
+    entities: dict[type[CoordinatorEntity], list[CoordinatorEntity]] = {
+        entity_cls: [] for entity_cls in DEVICE_ENTITIES.values()
+    }
+    for device in coordinator.data["devices"].values():
+        if entity_cls := DEVICE_ENTITIES.get(type(device)):
+            entities[entity_cls].append(entity_cls(coordinator, device.id))
+    coordinator.locks = entities[LockEntity]
+
+    # Only set up platforms that have entities
+    if coordinator.locks:
+        coordinator.platforms.append(Platform.LOCK)
 
     # Save as config entry data
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(
+        entry, coordinator.platforms
+    )
 
     return True
 
@@ -89,7 +76,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
-    if await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    if await hass.config_entries.async_unload_platforms(entry, coordinator.platforms):
         hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
         return True
     return False
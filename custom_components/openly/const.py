@@ -4,6 +4,13 @@ DOMAIN = "rently"
 
 API_MAX_LOGIN_ATTEMPTS = 3  # times
 API_LOGIN_RETRY_TIME = 3  # seconds
+API_LOGIN_TIMEOUT = 30  # seconds
+API_MAX_WORKERS = 4  # threads
+API_UPDATE_TIMEOUT = 30  # seconds
+
+UPDATE_INTERVAL = 60  # seconds
+UPDATE_INTERVAL_JITTER = 5  # seconds
 
 LOCK_UPDATE_DELAY = 8  # seconds
+LOCK_MAX_UPDATE_DELAY = 30  # seconds
 LOCK_MAX_REFRESH_ATTEMPTS = 3
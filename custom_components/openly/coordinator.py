@@ -1,65 +1,115 @@
 """Define a custom coordinator for Rently API communication."""
 import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 import logging
+import random
+from typing import Any, TypeVar
 
 from openly.cloud import RentlyCloud
+from openly.devices.base_device import BaseDevice
 from openly.exceptions import InvalidResponseError, RentlyAPIError, RentlyAuthError
 
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import API_LOGIN_RETRY_TIME, API_MAX_LOGIN_ATTEMPTS, DOMAIN
+from .const import (
+    API_LOGIN_RETRY_TIME,
+    API_LOGIN_TIMEOUT,
+    API_MAX_LOGIN_ATTEMPTS,
+    API_MAX_WORKERS,
+    API_UPDATE_TIMEOUT,
+    DOMAIN,
+    UPDATE_INTERVAL,
+    UPDATE_INTERVAL_JITTER,
+)
 from .hub import HubEntity
 from .lock import LockEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class CloudCoordinator(DataUpdateCoordinator):
     """Coordinator for Rently API.."""
 
-    def __init__(self, hass: HomeAssistant, cloud: RentlyCloud) -> None:
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, cloud: RentlyCloud
+    ) -> None:
         """Initialize my coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             # Name of the data. For logging purposes.
             name="Rently Hubs",
-            # Polling interval. Hubs are rarely updated. 15 minutes is reasonable.
-            update_interval=timedelta(seconds=900),
+            # Polling interval. Lock states are refreshed every minute, with a
+            # random offset so polls drift away from other integrations.
+            update_interval=timedelta(
+                seconds=UPDATE_INTERVAL + random.uniform(0, UPDATE_INTERVAL_JITTER)
+            ),
         )
         self.cloud = cloud
+        self._config_entry = config_entry
+        # Dedicated pool so refresh calls don't compete with other integrations
+        self._executor = ThreadPoolExecutor(
+            max_workers=API_MAX_WORKERS, thread_name_prefix=DOMAIN
+        )
         self.hubs: list[HubEntity] = []
         self.locks: list[LockEntity] = []
+        # Platforms forwarded for this entry
+        self.platforms: list[Platform] = []
+
+    @callback
+    def async_add_executor_job(
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Run a blocking API call in the coordinator executor."""
+        return self.hass.loop.run_in_executor(self._executor, target, *args)
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled refreshes and shut down the executor."""
+        await super().async_shutdown()
+        self._executor.shutdown(wait=False)
 
     async def async_login(self):
         """Login to Rently."""
-        async with asyncio.timeout(API_LOGIN_RETRY_TIME * API_MAX_LOGIN_ATTEMPTS):
+        async with asyncio.timeout(API_LOGIN_TIMEOUT):
             attempts = 1
             while not self.cloud.connected:
                 try:
-                    config_entry = self.hass.config_entries.async_entries(DOMAIN)[0]
-                    connected = await self.hass.async_add_executor_job(
+                    connected = await self.async_add_executor_job(
                         self.cloud.login,
-                        config_entry.data[CONF_EMAIL],
-                        config_entry.data[CONF_PASSWORD],
-                    )  # only 1 entry
+                        self._config_entry.data[CONF_EMAIL],
+                        self._config_entry.data[CONF_PASSWORD],
+                    )
                     if not connected:
                         raise RentlyAuthError("Could not connect to Rently")
                 except RentlyAPIError as err:
                     if attempts > API_MAX_LOGIN_ATTEMPTS:
                         raise InvalidResponseError from err
+                    # Back off linearly before the next attempt
+                    await asyncio.sleep(API_LOGIN_RETRY_TIME * attempts)
                     attempts += 1
-                    asyncio.sleep(API_LOGIN_RETRY_TIME)
 
-    async def _async_refresh(self, **kwargs):
-        # Make sure user is connected
-        await self.async_login()
+    def _update_device_status(self, device: BaseDevice) -> BaseDevice:
+        """Send the device command and read back the device."""
+        self.cloud.update_device_status(device)
+        return self.cloud.get_device(device.id)
 
-        return await super()._async_refresh(**kwargs)
+    async def async_update_device_status(self, device: BaseDevice) -> BaseDevice:
+        """Send the device command and read back the device.
+
+        The command and the read back run in a single executor job, on the
+        shared executor so they don't queue behind refreshes.
+        """
+        return await self.hass.async_add_executor_job(
+            self._update_device_status, device
+        )
 
     async def _async_update_data(self):
         """Fetch data from API endpoint.
@@ -68,11 +118,29 @@ class CloudCoordinator(DataUpdateCoordinator):
         so entities can quickly look up their data.
         """
         try:
-            # Return list of hubs
-            return await self.hass.async_add_executor_job(self.cloud.get_hubs)
+            # Make sure user is connected
+            await self.async_login()
+            async with asyncio.timeout(API_UPDATE_TIMEOUT):
+                # Retrieve list of hubs
+                hubs = await self.async_add_executor_job(self.cloud.get_hubs)
+                # Retrieve devices of all hubs concurrently
+                results = await asyncio.gather(
+                    *[
+                        self.async_add_executor_job(self.cloud.get_devices, hub.id)
+                        for hub in hubs
+                    ]
+                )
         except RentlyAuthError as err:
             # Raising ConfigEntryAuthFailed will cancel future updates
             # and start a config flow with SOURCE_REAUTH (async_step_reauth)
             raise ConfigEntryAuthFailed from err
         except InvalidResponseError as err:
             raise UpdateFailed("Error communicating with API") from err
+
+        # Index hubs and devices by ID so entities can look up their state directly
+        return {
+            "hubs": {hub.id: hub for hub in hubs},
+            "devices": {
+                device.id: device for devices in results for device in devices
+            },
+        }
@@ -18,7 +18,8 @@ async def async_setup_entry(
 ) -> None:
     """Initialize Hub entities from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(coordinator.hubs, update_before_add=True)
+    # Entities are seeded from the coordinator's first refresh
+    async_add_entities(coordinator.hubs)
 
 
 class HubEntity(CoordinatorEntity):
@@ -36,23 +37,12 @@ class HubEntity(CoordinatorEntity):
         """Pass coordinator to CoordinatorEntity."""
         super().__init__(coordinator, context=idx)
         self.idx: str = idx
-        self._hub: Hub = None
-
-    async def async_update(self) -> None:
-        """Update the entity.
-
-        Only used by the generic entity update service.
-        """
-        self._hub = await self.coordinator.hass.async_add_executor_job(
-            self.coordinator.cloud.get_hub, self.idx
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
+        self._hub: Hub = coordinator.data["hubs"].get(idx)
+        # Hub details are only present on hubs retrieved with get_hub
+        status = getattr(self._hub, "status", None) or {}
+        self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self.idx)},
-            name=self._hub.home_name,
-            model=self._hub.status.model,
-            sw_version=self._hub.status.fmVer,
+            name=getattr(self._hub, "home_name", None),
+            model=status.get("model"),
+            sw_version=status.get("fmVer"),
         )
@@ -1,8 +1,8 @@
 """Rently Lock Entity."""
 import asyncio
-from datetime import timedelta
+import copy
+import logging
 from typing import Any
-from venv import logger
 
 from openly.devices import Lock
 
@@ -14,9 +14,10 @@ from homeassistant.const import (
     STATE_LOCKED,
     STATE_LOCKING,
     STATE_UNAVAILABLE,
+    STATE_UNLOCKED,
     STATE_UNLOCKING,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -25,10 +26,14 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN, LOCK_MAX_REFRESH_ATTEMPTS, LOCK_UPDATE_DELAY
+from .const import (
+    DOMAIN,
+    LOCK_MAX_REFRESH_ATTEMPTS,
+    LOCK_MAX_UPDATE_DELAY,
+    LOCK_UPDATE_DELAY,
+)
 
-# Poll every minute
-SCAN_INTERVAL = timedelta(seconds=60)
+_LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
@@ -36,7 +41,8 @@ async def async_setup_entry(
 ) -> None:
     """Initialize Hub entities from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(coordinator.locks, update_before_add=True)
+    # Entities are seeded from the coordinator's first refresh
+    async_add_entities(coordinator.locks)
 
 
 class LockEntity(CoordinatorEntity, BaseLockEntity):
@@ -50,129 +56,131 @@ class LockEntity(CoordinatorEntity, BaseLockEntity):
         super().__init__(coordinator, context=idx)
         self.idx: str = idx
         self._attr_unique_id = f"rently-{idx}"
-        self._state = STATE_UNAVAILABLE
-
-    async def async_get_lock_status(self) -> bool:
-        """Retrieve the lock status."""
-        lock = await self.hass.async_add_executor_job(
-            self.coordinator.cloud.get_device, self.idx
+        self._set_state(STATE_UNAVAILABLE)
+        self._attr_extra_state_attributes = {}
+        # Set while waiting for the device to confirm a command
+        self._confirming = False
+        self._lock = coordinator.data["devices"].get(idx)
+        self._update_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Keep the requested state until the command is confirmed
+        if self._confirming:
+            return
+        self._lock = self.coordinator.data["devices"].get(self.idx)
+        previous = self._snapshot()
+        self._update_attributes()
+        # Skip writing the state when nothing changed
+        if self._snapshot() != previous:
+            self.async_write_ha_state()
+
+    def _snapshot(self) -> tuple:
+        """Return the attributes that make up the entity state."""
+        return (
+            self.available,
+            self.name,
+            self._state,
+            self.extra_state_attributes,
+            self.device_info,
         )
 
-        return lock.mode == STATE_LOCKED
-
-    async def async_update(self) -> None:
-        """Update the entity from the server."""
-        self._lock = await self.hass.async_add_executor_job(
-            self.coordinator.cloud.get_device, self.idx
-        )
+    def _update_attributes(self) -> None:
+        """Update the entity attributes from the current lock."""
         if not self._lock:
             if self.available:
-                logger.error("Lock not found")
+                _LOGGER.error("Lock not found")
             self._attr_available = False
             return
 
         self._attr_available = True
-        self._attr_extra_state_attributes = {
-            ATTR_BATTERY_LEVEL: self._lock.battery,
-        }
-        self._state = self._lock.mode
-
-    @property
-    def should_poll(self) -> bool:
-        """Return True if entity has to be polled for state."""
-        return True
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self._attr_available
-
-    @property
-    def name(self) -> str:
-        """Return the name of the lock."""
-        return self._lock.name
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return DeviceInfo(
+        self._attr_name = self._lock.name
+        # Only allocate new attributes when the battery level changed
+        battery = self._lock.battery
+        if self._attr_extra_state_attributes.get(ATTR_BATTERY_LEVEL) != battery:
+            self._attr_extra_state_attributes = {
+                ATTR_BATTERY_LEVEL: battery,
+            }
+        self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self.idx)},
-            name=self.name,
+            name=self._lock.name,
             manufacturer=self._lock.manufacturer,
             model=self._lock.product_name,
         )
+        self._set_state(self._lock.mode)
 
-    @property
-    def is_locked(self) -> bool:
-        """Return true if lock is locked."""
-        return self._state == STATE_LOCKED
-
-    @property
-    def is_jammed(self) -> bool:
-        """Return true if lock is jammed."""
-        return self._state == STATE_JAMMED
-
-    @property
-    def is_locking(self) -> bool:
-        """Return true if lock is locking."""
-        return self._state == STATE_LOCKING
+    def _set_state(self, state: str | None) -> None:
+        """Set the lock state and the matching lock attributes."""
+        self._state = state
+        self._attr_is_locked = state == STATE_LOCKED
+        self._attr_is_jammed = state == STATE_JAMMED
+        self._attr_is_locking = state == STATE_LOCKING
+        self._attr_is_unlocking = state == STATE_UNLOCKING
 
     @property
-    def is_unlocking(self) -> bool:
-        """Return true if lock is unlocking."""
-        return self._state == STATE_UNLOCKING
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self._attr_available
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the device."""
         if not self._lock:
             raise DeviceNotFoundError
-        self._state = STATE_LOCKING
+        # Set status on a copy, coordinator data is only updated once confirmed
+        command = copy.deepcopy(self._lock)
+        command.lock()
+        # Hold coordinator readings from the transitional state onward
+        self._confirming = True
+        self._set_state(STATE_LOCKING)
         self.async_write_ha_state()
-        # Set status
-        self._lock.lock()
-        # Send command
-        await self.hass.async_add_executor_job(
-            self.coordinator.cloud.update_device_status, self._lock
-        )
-
-        attempts = 1
-        while attempts < LOCK_MAX_REFRESH_ATTEMPTS:
-            # Wait for command to complete
-            await asyncio.sleep(LOCK_UPDATE_DELAY)
-            # Stop the loop when device is locked
-            locked = await self.async_get_lock_status()
-            if locked:
-                break
-            attempts += 1
-
-        # final update
-        await self.async_device_update()
+        await self._async_send_command(command, STATE_LOCKED)
 
     async def async_unlock(self, **kwargs: Any) -> None:
-        """Lock the device."""
+        """Unlock the device."""
         if not self._lock:
             raise DeviceNotFoundError
-        self._state = STATE_UNLOCKING
+        # Set status on a copy, coordinator data is only updated once confirmed
+        command = copy.deepcopy(self._lock)
+        command.unlock()
+        # Hold coordinator readings from the transitional state onward
+        self._confirming = True
+        self._set_state(STATE_UNLOCKING)
         self.async_write_ha_state()
-        # Set status
-        self._lock.unlock()
-        # Send command
-        await self.hass.async_add_executor_job(
-            self.coordinator.cloud.update_device_status, self._lock
-        )
-
-        attempts = 1
-        while attempts < LOCK_MAX_REFRESH_ATTEMPTS:
-            # Wait for command to complete
-            await asyncio.sleep(LOCK_UPDATE_DELAY)
-            # Stop the loop when device is unlocked
-            locked = await self.async_get_lock_status()
-            if not locked:
-                break
-            attempts += 1
-
-        # final update
-        await self.async_device_update()
+        await self._async_send_command(command, STATE_UNLOCKED)
+
+    async def _async_send_command(self, command: Lock, mode: str) -> None:
+        """Send the lock command and wait for the device to reach the mode."""
+        try:
+            # Send command and read back the device
+            lock = await self.coordinator.async_update_device_status(command)
+            # Optimistically publish the requested state
+            self._set_state(mode)
+            self.async_write_ha_state()
+
+            attempts = 1
+            delay = LOCK_UPDATE_DELAY
+            # Stop the loop when device reports the requested mode
+            while lock.mode != mode and attempts < LOCK_MAX_REFRESH_ATTEMPTS:
+                # Wait for command to complete
+                await asyncio.sleep(delay)
+                lock = await self.hass.async_add_executor_job(
+                    self.coordinator.cloud.get_device, self.idx
+                )
+                attempts += 1
+                # Back off exponentially between confirmations
+                delay = min(delay * 2, LOCK_MAX_UPDATE_DELAY)
+        except Exception:
+            # Restore the last known state
+            self._update_attributes()
+            self.async_write_ha_state()
+            raise
+        finally:
+            self._confirming = False
+
+        # The last reading is the current device state, no extra update needed
+        self.coordinator.data["devices"][self.idx] = lock
+        self._handle_coordinator_update()
 
 
 class DeviceNotFoundError(HomeAssistantError):